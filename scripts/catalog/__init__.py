@@ -11,7 +11,7 @@ __license__ = "MIT"
 
 from catalog.models import GameRecord, LetterItem
 from catalog.adapters.base import Adapter, AdapterConfig, Capabilities
-from catalog.io_writer import write_catalog
+from catalog.io_writer import CatalogWriter, write_catalog
 from catalog.runner import run_adapter
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
    "Adapter",
    "AdapterConfig",
    "Capabilities",
+   "CatalogWriter",
    "write_catalog",
    "run_adapter",
 ]
@@ -32,5 +33,10 @@ async def crawl(store_adapter: Adapter, out_dir: str) -> None:
    await run_adapter(store_adapter, out_dir)
 
 def crawl_sync(store_adapter: Adapter, out_dir: str) -> None:
-   """Synchronous alias for crawl(); wraps asyncio.run."""
+   """Synchronous alias for crawl(); wraps asyncio.run (on uvloop if installed)."""
+   try:
+      import uvloop
+      uvloop.install()
+   except ImportError:
+      pass
    asyncio.run(run_adapter(store_adapter, out_dir))
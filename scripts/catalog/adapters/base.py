@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Protocol
 
 import httpx
+import orjson
 
 from catalog.http import fetch, DomainLimiter, make_client
 from catalog.models import GameRecord
@@ -89,7 +90,8 @@ class Adapter(abc.ABC):
 
    async def get_json(self, url: str, **kw) -> Dict[str, Any]:
       r = await self.request("GET", url, **kw)
-      return r.json()
+      # orjson is much faster than httpx's stdlib-backed .json() on big bodies
+      return orjson.loads(r.content)
 
    async def get_text(self, url: str, **kw) -> str:
       r = await self.request("GET", url, **kw)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 import asyncio
-import json
-import re
+import sys
 from urllib.parse import quote_plus
 from dataclasses import dataclass, field
 from typing import AsyncIterator, Dict, Any, List, Optional, Set
 
+import orjson
+from selectolax.lexbor import LexborHTMLParser
+
 from catalog.adapters.base import Adapter, AdapterConfig, Capabilities
 from catalog.models import GameRecord
 from catalog.normalize import (
@@ -28,17 +30,44 @@ from catalog.http import DomainLimiter
 
 NIN_LIMIT = DomainLimiter(2.0)
 
-_JSONLD_RE = re.compile(
-   r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-   re.S | re.I
-)
-_NEXT_RE = re.compile(
-   r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
-   re.S | re.I
-)
+# orjson decodes the multi-MB embedded blobs several times faster than stdlib
+# json; its JSONDecodeError subclasses ValueError so existing handlers hold.
+_loads = orjson.loads
 
 _ASSET_HOST = "https://assets.nintendo.com"
 
+# Interned per-record constants: every GameRecord carries these, and interning
+# keeps one shared object per value instead of fresh strings, which also makes
+# the dict-key hashing in dedupe cheaper.
+_STORE = sys.intern("nintendo")
+_TYPE = sys.intern("game")
+_SWITCH = sys.intern("Switch")
+
+def _first(d: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+   """Return the first truthy value of *keys* in *d* (single probe per key)."""
+   for k in keys:
+      v = d.get(k)
+      if v:
+         return v
+   return default
+
+# JSON-LD @type values worth normalizing into records
+_LD_TARGET_TYPES = {"product", "videogame"}
+
+def _iter_ld_nodes(block: Any):
+   """Yield candidate JSON-LD nodes from a decoded block, flattening @graph."""
+   items = block if isinstance(block, list) else [block]
+   for b in items:
+      if not isinstance(b, dict):
+         continue
+      graph = b.get("@graph")
+      if isinstance(graph, list):
+         for g in graph:
+            if isinstance(g, dict):
+               yield g
+      else:
+         yield b
+
 def _normalize_asset_url(value: Optional[str]) -> Optional[str]:
    if not value:
       return value
@@ -121,10 +150,9 @@ class NintendoEndpoints:
    # Listing pages that contain many products (per locale)
    seed_pages: Optional[List[str]] = None
 
-def _default_seed_pages(country: str, locale: str) -> List[str]:
+def _default_seed_pages(country: str, loc: str) -> List[str]:
    # nintendo.com often uses paths like /en-us/store/games/
-   # normalize locale to "en-us" style
-   loc = locale.replace("_", "-").lower()
+   # *loc* is the locale already normalized to "en-us" style
    # country sometimes appears separately (us, ca, etc.). When not used, locale usually suffices.
    base = f"https://www.nintendo.com/{loc}/store/games"
    # A small set of broad catalogs; add/remove as your region exposes
@@ -144,6 +172,8 @@ class NintendoAdapter(Adapter):
    def __init__(self, *, config: AdapterConfig | None = None,
                 endpoints: NintendoEndpoints | None = None, **kw):
       super().__init__(config=config, **kw)
+      # "en-us"-style locale; recomputing this per record adds up over a crawl
+      self._loc = self.config.locale.replace("_", "-").lower()
       self.endpoints = endpoints or NintendoEndpoints(
          search_api="https://u3b6gr4ua3-1.algolianet.com/1/indexes/{index_name}/query",
          algolia_app_id="U3B6GR4UA3",
@@ -160,9 +190,12 @@ class NintendoAdapter(Adapter):
             "facets": ["*"],
             "maxValuesPerFacet": 100,
          },
-         seed_pages=_default_seed_pages(self.config.country, self.config.locale),
+         seed_pages=_default_seed_pages(self.config.country, self._loc),
       )
       self._resume_keys: Set[str] = set()
+      # Bounds how many seed pages are in flight at once; per-request pacing
+      # is still enforced by the adapter's DomainLimiter.
+      self._page_sem = asyncio.Semaphore(8)
 
    async def iter_games(self) -> AsyncIterator[GameRecord]:
       seen: Set[str] = set()
@@ -175,12 +208,14 @@ class NintendoAdapter(Adapter):
                   yield rec
          await asyncio.sleep(0.1)
 
-      # Strategy B: Listing pages with embedded JSON
-      for url in self.endpoints.seed_pages or []:
-         async for rec in self._iter_list_page(url):
+      # Strategy B: Listing pages with embedded JSON, fetched concurrently
+      pages = await asyncio.gather(
+         *(self._collect_page(url) for url in self.endpoints.seed_pages or [])
+      )
+      for page in pages:
+         for rec in page:
             if rec and self._should_emit(rec, seen):
                yield rec
-         await asyncio.sleep(0.2)
 
    def resume(self, records: List[GameRecord]) -> None:
       super().resume(records)
@@ -192,9 +227,11 @@ class NintendoAdapter(Adapter):
             self._resume_keys.add(key)
 
    def _record_key(self, rec: GameRecord) -> Optional[str]:
+      # str() the href: cache-resumed records carry HttpUrl while fast()-built
+      # ones carry plain str, and the two never compare equal.
       candidates = (
          rec.uuid,
-         rec.href,
+         rec.href and str(rec.href),
          rec.name and f"{rec.store}:{rec.name}",
       )
       return next((value for value in map(lambda candidate: candidate, candidates) if value), None)
@@ -312,21 +349,24 @@ class NintendoAdapter(Adapter):
                return v
       return []
 
-   def _normalize_api_item(self, it: Dict[str, Any]) -> Optional[GameRecord]:
+   def _normalize_api_item(self, it: Dict[str, Any],
+                           base_url: Optional[str] = None) -> Optional[GameRecord]:
+      # Reads search-API items and __NEXT_DATA__ tiles alike; *base_url* is the
+      # listing page a tile came from, used as the href of last resort.
+      if not isinstance(it, dict):
+         return None
       # Titles often under "title", "name", or "productTitle"
       name = strip_edition_noise(clean_title(
-         it.get("title") or it.get("name") or it.get("productTitle") or ""
+         _first(it, "title", "name", "productTitle", default="")
       ))
       if not name:
          return None
 
       # Image fields: hero, boxArt, imageUrl, keyImages[]
-      image = (
-         it.get("image") or it.get("imageUrl") or it.get("boxArt") or it.get("heroBanner") or
-         it.get("productImage") or it.get("productImageSquare")
-      )
+      image = _first(it, "image", "imageUrl", "boxArt", "heroBanner",
+                     "productImage", "productImageSquare")
       if not image:
-         imgs = it.get("images") or it.get("keyImages") or []
+         imgs = _first(it, "images", "keyImages", default=[])
          if isinstance(imgs, list) and imgs:
             # prefer box art if tagged, else first
             preferred = None
@@ -342,17 +382,17 @@ class NintendoAdapter(Adapter):
       image = _normalize_asset_url(str(image)) if image else "https://www.nintendo.com/etc.clientlibs/ncom/clientlibs/clientlib-ncom/resources/img/nintendo_red.svg"
 
       # Href: product page URL (or build from slug/nsuid)
-      href = (
-         it.get("productUrl") or it.get("url") or it.get("webUrl")
-      )
+      href = _first(it, "productUrl", "url", "webUrl", "href")
       if not href:
-         slug = it.get("slug") or it.get("seoName")
-         nsuid = it.get("nsuid") or it.get("id")
-         loc = self.config.locale.replace("_", "-").lower()
+         slug = _first(it, "slug", "seoName")
+         nsuid = _first(it, "nsuid", "id")
+         loc = self._loc
          if slug:
             href = f"https://www.nintendo.com/{loc}/store/products/{slug}/"
          elif nsuid:
             href = f"https://www.nintendo.com/{loc}/store/products/{nsuid}/"
+         elif base_url:
+            href = base_url
          else:
             href = f"https://www.nintendo.com/{loc}/store/"
 
@@ -366,44 +406,47 @@ class NintendoAdapter(Adapter):
 
       # Price normalization
       # We prefer display strings when Nintendo provides them ("Free", "$59.99", etc.).
+      # Tiles sometimes carry "price" as a bare display string rather than an object.
+      price_raw = it.get("price")
       display = (
-         (it.get("price") or {}).get("display") or
+         (price_raw.get("display") if isinstance(price_raw, dict) else
+          price_raw if isinstance(price_raw, str) else None) or
          it.get("displayPrice") or
          it.get("priceDisplay")
       )
       amount = None
       currency = None
-      price_obj = it.get("price") or {}
+      price_obj = price_raw if isinstance(price_raw, dict) else {}
       if isinstance(price_obj, dict):
          # Possible numeric fields: "regular", "discounted", "current", "amount"
-         amt = price_obj.get("discounted") or price_obj.get("current") or price_obj.get("regular") or price_obj.get("amount")
+         amt = _first(price_obj, "discounted", "current", "regular", "amount")
          try:
             amount = float(amt) if amt is not None else None
          except Exception:
             amount = None
-         currency = price_obj.get("currency") or price_obj.get("currencyCode")
+         currency = _first(price_obj, "currency", "currencyCode")
       eshop_details = it.get("eshopDetails") if isinstance(it.get("eshopDetails"), dict) else {}
       if isinstance(price_obj, dict):
          amt_guess, cur_guess, disp_guess = _extract_price_components(price_obj, eshop_details)
          amount = amount or amt_guess
          currency = currency or cur_guess
-         if not isinstance(display, string_types()) and disp_guess:
+         if not isinstance(display, str) and disp_guess:
             display = disp_guess
-      if not isinstance(display, string_types()) and isinstance(eshop_details, dict):
+      if not isinstance(display, str) and isinstance(eshop_details, dict):
          maybe_flag = eshop_details.get("goldPointOfferType")
          if maybe_flag:
             display = maybe_flag
-      price_str = display if isinstance(display, string_types()) else price_to_string(amount, currency)
+      price_str = display if isinstance(display, str) else price_to_string(amount, currency)
 
       # Platforms: almost always "Switch" for Nintendo store data
-      platforms = it.get("platforms") or it.get("platform") or []
+      platforms = _first(it, "platforms", "platform", default=[])
       if isinstance(platforms, str):
          platforms = [platforms]
       if not platforms:
-         platforms = ["Switch"]
-      platforms = normalize_platforms(platforms)
+         platforms = [_SWITCH]
+      platforms = [sys.intern(p) for p in normalize_platforms(platforms)]
 
-      raw_rating = it.get("rating") or it.get("ratings")
+      raw_rating = _first(it, "rating", "ratings")
       if isinstance(raw_rating, dict):
          raw_rating = raw_rating.get("display") or raw_rating.get("name")
       elif isinstance(raw_rating, list) and raw_rating:
@@ -413,10 +456,10 @@ class NintendoAdapter(Adapter):
       rating = normalize_rating(raw_rating)
 
       # UUID: NSUID preferred if present
-      uuid = it.get("nsuid") or it.get("id") or it.get("productId")
+      uuid = _first(it, "nsuid", "id", "productId")
 
-      return GameRecord(
-         store="nintendo",
+      return GameRecord.fast(
+         store=_STORE,
          name=name,
          price=price_str,
          image=image,
@@ -424,121 +467,87 @@ class NintendoAdapter(Adapter):
          uuid=str(uuid) if uuid else None,
          platforms=platforms,
          rating=rating,
-         type="game",
+         type=_TYPE,
       )
 
    # ---------- Strategy B: HTML + embedded JSON ----------
 
+   async def _collect_page(self, url: str) -> List[Optional[GameRecord]]:
+      async with self._page_sem:
+         return [rec async for rec in self._iter_list_page(url)]
+
    async def _iter_list_page(self, url: str) -> AsyncIterator[Optional[GameRecord]]:
       html = await self.get_text(url, headers={"Accept": "text/html"})
-      # 1) __NEXT_DATA__
-      for rec in self._parse_next_data(html, base_url=url):
-         yield rec
-      # 2) JSON-LD
-      for rec in self._parse_jsonld(html, base_url=url):
+      # Parsing a multi-hundred-KB page is CPU-bound; run it in a worker
+      # thread (lexbor releases the GIL while parsing) so concurrent pages
+      # and other adapters keep the event loop.
+      for rec in await asyncio.to_thread(self._parse_all, html, url):
          yield rec
 
-   def _parse_next_data(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
+   def _parse_all(self, html: str, base_url: str) -> List[Optional[GameRecord]]:
+      # Parse the DOM once (lexbor is C-backed; far cheaper than regexing the
+      # whole page) and pull every embedded-JSON <script> from it.
+      tree = LexborHTMLParser(html)
+      out = self._parse_next_data(tree, base_url=base_url)
+      out.extend(self._parse_jsonld(tree, base_url=base_url))
+      return out
+
+   def _parse_next_data(self, tree: LexborHTMLParser, *, base_url: str) -> List[Optional[GameRecord]]:
       out: List[Optional[GameRecord]] = []
-      m = _NEXT_RE.search(html)
-      if not m:
+      node = tree.css_first("script#__NEXT_DATA__")
+      if node is None:
          return out
       try:
-         js = json.loads(m.group(1))
+         js = _loads(node.text())
       except Exception:
          return out
 
-      # Walk the Next.js tree to locate product arrays
-      def walk(o: Any):
+      # Walk the Next.js tree to locate product arrays. Iterative on purpose:
+      # deep pages would blow the recursion limit, and an explicit stack skips
+      # the per-node frame overhead of a recursive helper.
+      stack: List[Any] = [js]
+      while stack:
+         o = stack.pop()
          if isinstance(o, dict):
             # frequent keys: "products", "items", "results", "tiles"
             for key in ("products", "items", "results", "tiles"):
                v = o.get(key)
                if isinstance(v, list):
                   for it in v:
-                     rec = self._normalize_api_item(self._coerce_to_api_like(it, base_url))
+                     rec = self._normalize_api_item(it, base_url=base_url)
                      if rec:
                         out.append(rec)
-            for v in o.values():
-               walk(v)
+            stack.extend(o.values())
          elif isinstance(o, list):
-            for v in o:
-               walk(v)
-
-      walk(js)
+            stack.extend(o)
       return out
 
-   def _coerce_to_api_like(self, it: Any, base_url: str) -> Dict[str, Any]:
-      """
-      Convert a heterogeneous tile/card into a dict compatible with _normalize_api_item.
-      """
-      if not isinstance(it, dict):
-         return {}
-      guess: Dict[str, Any] = {}
-
-      # name/title
-      guess["title"] = it.get("title") or it.get("name") or it.get("productTitle") or ""
-
-      # image(s)
-      if it.get("imageUrl") or it.get("image"):
-         guess["imageUrl"] = it.get("imageUrl") or it.get("image")
-      else:
-         imgs = it.get("images") or it.get("keyImages") or []
-         if imgs:
-            guess["keyImages"] = imgs
-
-      # link
-      link = it.get("url") or it.get("href") or it.get("productUrl")
-      guess["productUrl"] = link or base_url
-
-      # price (can be object or display string)
-      price = it.get("price") or it.get("displayPrice") or it.get("priceDisplay")
-      if isinstance(price, dict):
-         guess["price"] = price
-      elif isinstance(price, str):
-         guess["displayPrice"] = price
-
-      # ids
-      guess["nsuid"] = it.get("nsuid") or it.get("id") or it.get("productId")
-
-      # platforms
-      plats = it.get("platforms")
-      if isinstance(plats, list):
-         guess["platforms"] = normalize_platforms(plats)
-      elif isinstance(plats, str):
-         guess["platforms"] = normalize_platforms([plats])
-
-      return guess
-
    def _coerce_algolia_hit(self, hit: Any) -> Dict[str, Any]:
       if not isinstance(hit, dict):
          return {}
       guess: Dict[str, Any] = {}
 
-      slug = hit.get("slug") or hit.get("urlKey")
+      slug = _first(hit, "slug", "urlKey")
       if slug:
          guess.setdefault("slug", slug)
 
-      guess["title"] = hit.get("title") or hit.get("name") or hit.get("productTitle") or ""
-      guess["nsuid"] = hit.get("nsuid") or hit.get("id") or hit.get("productId")
+      guess["title"] = _first(hit, "title", "name", "productTitle", default="")
+      guess["nsuid"] = _first(hit, "nsuid", "id", "productId")
 
-      image = (
-         hit.get("boxArt") or hit.get("heroBanner") or hit.get("image") or
-         hit.get("productImage") or hit.get("productImageSquare")
-      )
+      image = _first(hit, "boxArt", "heroBanner", "image",
+                     "productImage", "productImageSquare")
       if image:
          guess["image"] = _normalize_asset_url(str(image))
 
-      link = hit.get("url") or hit.get("productUrl")
+      link = _first(hit, "url", "productUrl")
       if not link and slug:
-         loc = self.config.locale.replace("_", "-").lower()
-         link = f"https://www.nintendo.com/{loc}/store/products/{slug}/"
+         link = f"https://www.nintendo.com/{self._loc}/store/products/{slug}/"
       guess["productUrl"] = link or None
 
-      price = hit.get("price") or hit.get("prices") or {}
+      price = _first(hit, "price", "prices", default={})
       eshop_details = hit.get("eshopDetails") if isinstance(hit.get("eshopDetails"), dict) else {}
       amt, cur, disp = _extract_price_components(price, eshop_details)
-      currency = cur or (price.get("currency") if isinstance(price, dict) else None) or hit.get("currency") or hit.get("currencyCode")
+      currency = cur or (price.get("currency") if isinstance(price, dict) else None) or _first(hit, "currency", "currencyCode")
       if amt is not None or currency:
          guess["price"] = {"amount": amt, "currency": currency}
       if disp:
@@ -546,17 +555,17 @@ class NintendoAdapter(Adapter):
       elif isinstance(price, str):
          guess["displayPrice"] = price
 
-      display_price = hit.get("priceDisplay") or hit.get("price_display") or hit.get("priceText")
+      display_price = _first(hit, "priceDisplay", "price_display", "priceText")
       if display_price and "displayPrice" not in guess:
          guess["displayPrice"] = display_price
 
-      plats = hit.get("platforms") or hit.get("platform") or hit.get("corePlatforms")
+      plats = _first(hit, "platforms", "platform", "corePlatforms")
       if isinstance(plats, list):
          guess["platforms"] = normalize_platforms(plats)
       elif isinstance(plats, str):
          guess["platforms"] = normalize_platforms([plats])
 
-      rating = hit.get("rating") or hit.get("esrb") or hit.get("ageRating") or hit.get("contentRating")
+      rating = _first(hit, "rating", "esrb", "ageRating", "contentRating")
       if isinstance(rating, dict):
          rating = rating.get("label") or rating.get("code")
       if rating:
@@ -564,30 +573,17 @@ class NintendoAdapter(Adapter):
 
       return guess
 
-   def _parse_jsonld(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
+   def _parse_jsonld(self, tree: LexborHTMLParser, *, base_url: str) -> List[Optional[GameRecord]]:
       out: List[Optional[GameRecord]] = []
-      for m in _JSONLD_RE.finditer(html):
+      for node in tree.css('script[type="application/ld+json"]'):
          try:
-            block = json.loads(m.group(1))
+            block = _loads(node.text())
          except Exception:
             continue
-         blocks = block if isinstance(block, list) else [block]
-         for b in blocks:
-            if not isinstance(b, dict):
-               continue
-            # Accept Product/VideoGame schemas, or walk @graph
-            types = {str(b.get("@type","")).lower()}
-            if "@graph" in b and isinstance(b["@graph"], list):
-               for g in b["@graph"]:
-                  if not isinstance(g, dict):
-                     continue
-                  t = str(g.get("@type","")).lower()
-                  if t in {"product","videogame"}:
-                     rec = self._normalize_jsonld_item(g, base_url)
-                     if rec:
-                        out.append(rec)
-            elif types & {"product","videogame"}:
-               rec = self._normalize_jsonld_item(b, base_url)
+         # Accept Product/VideoGame schemas, whether top-level or in @graph
+         for ld_node in _iter_ld_nodes(block):
+            if str(ld_node.get("@type", "")).lower() in _LD_TARGET_TYPES:
+               rec = self._normalize_jsonld_item(ld_node, base_url)
                if rec:
                   out.append(rec)
       return out
@@ -614,13 +610,13 @@ class NintendoAdapter(Adapter):
       href = b.get("url") or base_url
 
       # Nintendo output is primarily Switch
-      platforms: List[str] = normalize_platforms(["Switch"])
+      platforms: List[str] = [sys.intern(p) for p in normalize_platforms([_SWITCH])]
 
       # NSUID is sometimes available in JSON-LD (not guaranteed)
-      uuid = b.get("sku") or b.get("productID") or b.get("mpn") or None
+      uuid = _first(b, "sku", "productID", "mpn")
 
-      return GameRecord(
-         store="nintendo",
+      return GameRecord.fast(
+         store=_STORE,
          name=name,
          price=price_str,
          image=str(image) if image else "https://www.nintendo.com/etc.clientlibs/ncom/clientlibs/clientlib-ncom/resources/img/nintendo_red.svg",
@@ -628,12 +624,5 @@ class NintendoAdapter(Adapter):
          uuid=str(uuid) if uuid else None,
          platforms=platforms,
          rating=None,
-         type="game",
+         type=_TYPE,
       )
-
-# Small helper to check str-ness in a typed way
-def string_types():
-   try:
-      return (str,)
-   except Exception:
-      return (str,)
@@ -103,7 +103,10 @@ class CatalogCache:
       """Insert or update *record* inside the cache."""
 
       key = cache_key_for_record(record)
-      payload = record.model_dump(mode="json")
+      # warnings=False: GameRecord.fast() records hold str where the schema
+      # says HttpUrl; the values serialize fine but pydantic would emit a
+      # UserWarning per record on the default crawl path.
+      payload = record.model_dump(mode="json", warnings=False)
       payload.setdefault("store", record.store)
       now = datetime.utcnow()
 
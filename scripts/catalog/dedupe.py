@@ -1,16 +1,31 @@
 # catalog/dedupe.py
-import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, Tuple, List
 from catalog.models import GameRecord
 from catalog.normalize import strip_edition_noise
 
+_KEEP = frozenset(map(ord, "abcdefghijklmnopqrstuvwxyz0123456789"))
+
+class _DropNonAlnum(dict):
+   """
+   str.translate table that keeps [a-z0-9] and deletes everything else.
+   Decisions are memoized per codepoint, so after warm-up translate runs
+   entirely in C — noticeably faster than a regex sub per record.
+   """
+   def __missing__(self, codepoint: int):
+      keep = codepoint if codepoint in _KEEP else None
+      self[codepoint] = keep
+      return keep
+
+_TBL = _DropNonAlnum()
+
+@lru_cache(maxsize=65536)
 def canonical_key(name: str) -> str:
-   base = strip_edition_noise(name)
-   return re.sub(r"[^a-z0-9]+", "", base.lower())
+   return strip_edition_noise(name).lower().translate(_TBL)
 
 def cluster(records: List[GameRecord]) -> Dict[str, List[GameRecord]]:
-   buckets: Dict[str, List[GameRecord]] = {}
+   buckets: Dict[str, List[GameRecord]] = defaultdict(list)
    for r in records:
-      k = canonical_key(r.name)
-      buckets.setdefault(k, []).append(r)
-   return buckets
+      buckets[canonical_key(r.name)].append(r)
+   return dict(buckets)
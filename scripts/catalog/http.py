@@ -1,24 +1,89 @@
-import asyncio, random
+import asyncio, random, time
 from contextlib import asynccontextmanager
 import httpx
-from aiolimiter import AsyncLimiter
 
 RETRYABLE = {408, 425, 429, 500, 502, 503, 504}
 
 @asynccontextmanager
 async def make_client():
+   # DNS never blocks the event loop here: httpx resolves via anyio worker
+   # threads. The 300s keepalive_expiry keeps connections (and therefore
+   # resolved addresses) warm across the idle gaps the rate limiter inserts,
+   # so a slow multi-store crawl doesn't re-resolve and re-handshake per burst.
    async with httpx.AsyncClient(http2=True, timeout=30.0, headers={
       "User-Agent": "game-catalog (contact: maintainer@example.com)",
       "Accept": "application/json, text/html;q=0.9,*/*;q=0.8",
-   }) as client:
+   }, limits=httpx.Limits(
+      max_connections=64,
+      max_keepalive_connections=64,
+      keepalive_expiry=300.0,
+   )) as client:
       yield client
 
 class DomainLimiter:
-   def __init__(self, rps: float):
-      self.limiter = AsyncLimiter(rps, time_period=1)
+   """
+   Adaptive token bucket, one per domain.
+
+   Refills continuously at ``rate`` requests/second, starting from the
+   configured ceiling. fetch() feeds response headers back through
+   update_from_headers(): Retry-After or a near-exhausted X-RateLimit window
+   throttles the refill rate, and each untroubled response recovers it a few
+   percent back toward the ceiling. A fixed cap either undersubscribes a fast
+   mirror or hammers a throttled one; this tracks what the server advertises.
+   """
+
+   # never adapt below this, so one bad header can't park the crawl
+   MIN_RATE = 0.1
+
+   def __init__(self, rps: float, *, burst: float | None = None):
+      self.max_rate = float(rps)
+      self.rate = float(rps)
+      self.capacity = float(burst) if burst is not None else max(1.0, float(rps))
+      self.tokens = self.capacity
+      self._last = time.monotonic()
+      self._lock = asyncio.Lock()
 
    async def wait(self):
-      await self.limiter.acquire()
+      async with self._lock:
+         while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self.tokens >= 1.0:
+               self.tokens -= 1.0
+               return
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+   def update_from_headers(self, headers) -> None:
+      retry_after = headers.get("Retry-After")
+      if retry_after:
+         try:
+            delay = float(retry_after)
+         except (TypeError, ValueError):
+            delay = None
+         if delay and delay > 0:
+            self.rate = max(self.MIN_RATE, min(self.rate, 1.0 / delay))
+            return
+
+      remaining = headers.get("X-RateLimit-Remaining")
+      reset = headers.get("X-RateLimit-Reset")
+      if remaining is not None and reset is not None:
+         try:
+            remaining_n = float(remaining)
+            window = float(reset)
+         except (TypeError, ValueError):
+            pass
+         else:
+            # Reset may be an epoch timestamp rather than a relative window
+            if window > 1e6:
+               window -= time.time()
+            if window > 0:
+               self.rate = max(self.MIN_RATE, min(self.max_rate, remaining_n / window))
+               return
+
+      # no back-pressure signal: creep back toward the configured ceiling
+      if self.rate < self.max_rate:
+         self.rate = min(self.max_rate, self.rate * 1.05)
 
 async def fetch(client: httpx.AsyncClient, method: str, url: str, *,
                 params=None, headers=None, json=None, data=None,
@@ -39,6 +104,8 @@ async def fetch(client: httpx.AsyncClient, method: str, url: str, *,
             data=data,
             follow_redirects=True,
          )
+         if limiter:
+            limiter.update_from_headers(r.headers)
          if r.status_code in RETRYABLE:
             attempt += 1
             if attempt > max_retries:
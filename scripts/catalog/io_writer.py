@@ -1,23 +1,47 @@
 from __future__ import annotations
 
-import json
 import os
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
+
+import orjson
 
 from catalog.models import GameRecord, LetterItem
 from catalog.normalize import letter_bucket
 
-def write_catalog(out_dir: str, store: str, rows: Iterable[GameRecord]) -> None:
-   base = os.path.join(out_dir, store)
-   os.makedirs(base, exist_ok=True)
 
-   # Build per-letter arrays and the bang Map-as-array
-   buckets: dict[str, List[LetterItem]] = defaultdict(list)
-   bang: List[Tuple[str, dict]] = []
+class CatalogWriter:
+   """
+   Incremental writer for one store catalog.
 
-   for rec in rows:
+   Records are converted to LetterItem as they arrive and keyed by uuid (or
+   href as a fallback) so a re-crawled record replaces its cached ancestor
+   instead of duplicating it. Dirty per-letter files are rewritten every
+   *flush_every* additions, letting disk I/O overlap the crawl; close()
+   flushes the remainder and writes the metadata ($.json) and bang (!.json)
+   files.
+   """
+
+   def __init__(self, out_dir: str, store: str, *, flush_every: int | None = 500):
+      self.base = os.path.join(out_dir, store)
+      os.makedirs(self.base, exist_ok=True)
+      self._flush_every = flush_every if flush_every is None else max(1, flush_every)
+      # key -> (letter, name, item); insertion order is irrelevant, output is sorted
+      self._items: Dict[str, Tuple[str, str, LetterItem]] = {}
+      self._dirty: Set[str] = set()
+      self._since_flush = 0
+      self._closed = False
+
+   def __len__(self) -> int:
+      return len(self._items)
+
+   @property
+   def pending(self) -> int:
+      """Additions since the last flush; lets async callers schedule flushes."""
+      return self._since_flush
+
+   def add(self, rec: GameRecord) -> None:
       item = LetterItem(
          name=rec.name,
          type=rec.type,
@@ -28,47 +52,93 @@ def write_catalog(out_dir: str, store: str, rows: Iterable[GameRecord]) -> None:
          platforms=rec.platforms,
          rating=rec.rating if rec.rating else None
       )
-      buckets[letter_bucket(rec.name)].append(item)
-      bang.append((rec.name, item.model_dump(mode="json")))
-
-   # stable-ish ordering per-letter
-   for k in buckets:
-      buckets[k].sort(key=lambda i: i.name.lower())
-
-   # ensure global bang list is sorted for deterministic output
-   bang.sort(key=lambda item: item[0].lower())
-
-   # Write per-letter
-   for k in sorted(buckets):
-      arr = buckets[k]
-      with open(os.path.join(base, f"{k}.json"), "w", encoding="utf-8") as fp:
-         json.dump([i.model_dump(mode="json") for i in arr], fp, ensure_ascii=False, indent=4)
-
-   # Write metadata and bang files
-   metadata_path = os.path.join(base, "$.json")
-   previous_size = None
-   if os.path.exists(metadata_path):
+      key = rec.uuid or str(rec.href)
+      letter = letter_bucket(rec.name)
+      previous = self._items.get(key)
+      self._items[key] = (letter, rec.name, item)
+      self._dirty.add(letter)
+      if previous is not None and previous[0] != letter:
+         self._dirty.add(previous[0])
+      self._since_flush += 1
+      if self._flush_every is not None and self._since_flush >= self._flush_every:
+         self.flush()
+
+   def flush(self) -> None:
+      """Rewrite every per-letter file touched since the last flush."""
+      if not self._dirty:
+         self._since_flush = 0
+         return
+      buckets: Dict[str, List[LetterItem]] = defaultdict(list)
+      for letter, _name, item in self._items.values():
+         if letter in self._dirty:
+            buckets[letter].append(item)
+      for letter in self._dirty:
+         arr = buckets.get(letter, [])
+         arr.sort(key=lambda i: i.name.lower())
+         self._write_json(
+            os.path.join(self.base, f"{letter}.json"),
+            [i.model_dump(mode="json") for i in arr],
+         )
+      self._dirty.clear()
+      self._since_flush = 0
+
+   def close(self) -> None:
+      """Flush remaining buckets and write the metadata and bang files."""
+      if self._closed:
+         return
+      self._closed = True
+      self.flush()
+
+      # list pairs, not tuples: orjson only serializes lists
+      bang: List[List] = [
+         [name, item.model_dump(mode="json")]
+         for _letter, name, item in self._items.values()
+      ]
+      # ensure global bang list is sorted for deterministic output
+      bang.sort(key=lambda entry: entry[0].lower())
+
+      metadata_path = os.path.join(self.base, "$.json")
+      previous_size = None
+      if os.path.exists(metadata_path):
+         try:
+            with open(metadata_path, "rb") as fp:
+               previous = orjson.loads(fp.read())
+         except (OSError, ValueError, TypeError):
+            previous = None
+         else:
+            if isinstance(previous, dict) and "size" in previous:
+               try:
+                  previous_size = int(previous["size"])
+               except (TypeError, ValueError):
+                  previous_size = None
+
+      size = len(bang)
+      delta = size - (previous_size if previous_size is not None else size)
+      metadata = {
+         "size": size,
+         "diff": delta,
+         "date": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+      }
+      self._write_json(metadata_path, metadata)
+      self._write_json(os.path.join(self.base, "!.json"), bang)
+
+   @staticmethod
+   def _write_json(path: str, payload) -> None:
+      # Serialize the whole file in one orjson call and hand the blob to the
+      # kernel in a single write; this path is hit on every flush. orjson
+      # emits raw UTF-8 (same as ensure_ascii=False did) but only supports
+      # two-space indentation.
+      blob = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+      fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
       try:
-         with open(metadata_path, "r", encoding="utf-8") as fp:
-            previous = json.load(fp)
-      except (OSError, ValueError, TypeError):
-         previous = None
-      else:
-         if isinstance(previous, dict) and "size" in previous:
-            try:
-               previous_size = int(previous["size"])
-            except (TypeError, ValueError):
-               previous_size = None
-
-   size = len(bang)
-   delta = size - (previous_size if previous_size is not None else size)
-   metadata = {
-      "size": size,
-      "diff": delta,
-      "date": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
-   }
-   with open(metadata_path, "w", encoding="utf-8") as fp:
-      json.dump(metadata, fp, ensure_ascii=False, indent=4)
-
-   with open(os.path.join(base, "!.json"), "w", encoding="utf-8") as fp:
-      json.dump(bang, fp, ensure_ascii=False, indent=4)
+         os.write(fd, blob)
+      finally:
+         os.close(fd)
+
+
+def write_catalog(out_dir: str, store: str, rows: Iterable[GameRecord]) -> None:
+   # Bulk path: all rows are already in hand, so skip intermediate flushes.
+   writer = CatalogWriter(out_dir, store, flush_every=None)
+   for rec in rows:
+      writer.add(rec)
+   writer.close()
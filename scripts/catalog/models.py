@@ -66,6 +66,18 @@ class GameRecord(BaseModel):
    type: Optional[str] = None
    extra: Dict[str, Any] = Field(default_factory=dict)
 
+   @classmethod
+   def fast(cls, **fields: Any) -> "GameRecord":
+      """
+      Validation-free constructor for adapter hot loops.
+
+      Adapters normalize every field before building a record, so the full
+      pydantic validation pass (HttpUrl parsing, the validators below) is
+      redundant work per item. model_construct skips it; the data is still
+      validated when converted to LetterItem at write time.
+      """
+      return cls.model_construct(**fields)
+
    @field_validator("price")
    @classmethod
    def _price_nonempty(cls, v: str) -> str:
@@ -1,14 +1,34 @@
 import re
+from functools import lru_cache
 from typing import Optional
 
+try:
+   import re2 as _re2  # optional: linear-time DFA engine (pip install google-re2)
+except ImportError:
+   _re2 = None
+
+def _compile_noise(pattern: str):
+   """
+   Compile a case-insensitive alternation, preferring RE2 when installed.
+
+   The edition/platform alternations below are scanned twice per title during
+   dedupe; RE2's DFA walks them in constant time per byte where stdlib re
+   backtracks. The compiled objects are drop-in (.sub-compatible).
+   """
+   if _re2 is not None:
+      try:
+         return _re2.compile(pattern, _re2.IGNORECASE)
+      except _re2.error:
+         pass
+   return re.compile(pattern, re.I)
+
 _MARK_RX = re.compile(r"[™®©]", re.U)
-_EDITION_RX = re.compile(
-   r"\b(deluxe|definitive|gold|ultimate|goty|complete|remastered|hd|bundle|collection|director'?s cut|edition|standard|launch|classic)\b",
-   re.I
+_WS_RX = re.compile(r"\s{2,}")
+_EDITION_RX = _compile_noise(
+   r"\b(deluxe|definitive|gold|ultimate|goty|complete|remastered|hd|bundle|collection|director'?s cut|edition|standard|launch|classic)\b"
 )
-_PLATFORM_NOISE_RX = re.compile(
-   r"\b(ps\s*4|ps\s*5|playstation\s*4|playstation\s*5|xbox(\s+one|\s+series\s+x\|?s)?|series\s+x\|?s|nintendo\s+switch|switch)\b",
-   re.I
+_PLATFORM_NOISE_RX = _compile_noise(
+   r"\b(ps\s*4|ps\s*5|playstation\s*4|playstation\s*5|xbox(\s+one|\s+series\s+x\|?s)?|series\s+x\|?s|nintendo\s+switch|switch)\b"
 )
 
 _CURRENCY_SYMBOLS = {
@@ -83,16 +103,18 @@ _RATING_MAP = {
    "cero z": "mature 17+",
 }
 
+# Both functions are pure and the same SKU often appears on several listing
+# pages (and again in dedupe), so memoize per title.
+@lru_cache(maxsize=65536)
 def clean_title(name: str) -> str:
-   t = _MARK_RX.sub("", name or "").strip()
-   t = re.sub(r"\s{2,}", " ", t)
-   return t
+   return _WS_RX.sub(" ", _MARK_RX.sub("", name or "").strip())
 
+@lru_cache(maxsize=65536)
 def strip_edition_noise(name: str) -> str:
    t = clean_title(name)
    t = _PLATFORM_NOISE_RX.sub("", t)
    t = _EDITION_RX.sub("", t)
-   t = re.sub(r"\s{2,}", " ", t).strip(" -–—")
+   t = _WS_RX.sub(" ", t).strip(" -–—")
    return t or clean_title(name)
 
 def price_to_string(amount: Optional[float], currency: Optional[str], *, flags: Optional[str] = None) -> str:
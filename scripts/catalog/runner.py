@@ -1,11 +1,12 @@
 from __future__ import annotations
+import asyncio
 from typing import Dict, List, Optional
 
 from rich.progress import Progress
 
 from catalog.adapters.base import Adapter
 from catalog.db import CatalogCache, cache_key_for_record
-from catalog.io_writer import write_catalog
+from catalog.io_writer import CatalogWriter, write_catalog
 from catalog.models import GameRecord
 
 async def run_adapter(
@@ -24,6 +25,12 @@ async def run_adapter(
          buf: List[GameRecord] = []
          index_by_key: Dict[str, int] = {}
          count = 0
+         # Stream records to disk as they arrive instead of holding the write
+         # until the last page; the writer replaces records by cache key.
+         # Auto-flush is disabled so flushes run in a worker thread below and
+         # never block the event loop (other adapters share it).
+         writer = CatalogWriter(out_dir, a.store, flush_every=None)
+         flush_every = 500
 
          if cache is not None and resume:
             cached_records = cache.load(a.store)
@@ -32,6 +39,7 @@ async def run_adapter(
                buf.extend(cached_records)
                for idx, rec in enumerate(buf):
                   index_by_key[cache_key_for_record(rec)] = idx
+                  writer.add(rec)
                count = len(buf)
                try:
                   a.resume(cached_records)
@@ -52,16 +60,19 @@ async def run_adapter(
                index_by_key[key] = len(buf)
                buf.append(rec)
                count += 1
+            writer.add(rec)
+            if writer.pending >= flush_every:
+               await asyncio.to_thread(writer.flush)
             if cache is not None:
                cache.store_record(rec)
             if count % 100 == 0:
                log.info("[%s] collected %d records", a.store, count)
             if progress is not None and task_id is not None:
                progress.update(task_id, description=f"{a.store}: collected {count} records")
-         log.info("[%s] writing %d records", a.store, len(buf))
+         log.info("[%s] writing %d records", a.store, len(writer))
          if progress is not None and task_id is not None:
-            progress.update(task_id, description=f"{a.store}: writing {len(buf)} records")
-         write_catalog(out_dir, a.store, buf)
+            progress.update(task_id, description=f"{a.store}: writing {len(writer)} records")
+         await asyncio.to_thread(writer.close)
          for child_store, child_rows in (a.child_catalogs(buf) or {}).items():
             if not child_rows:
                continue
@@ -71,7 +82,7 @@ async def run_adapter(
                len(child_rows),
                child_store,
             )
-            write_catalog(out_dir, child_store, child_rows)
+            await asyncio.to_thread(write_catalog, out_dir, child_store, child_rows)
          log.info(
             "[%s] complete (fetched=%d parsed=%d quarantined=%d)",
             a.store,
@@ -3,6 +3,14 @@ import argparse
 import asyncio
 import logging
 
+try:
+   # Optional on Linux/macOS (pip install 'store-scraper[speed]'); unavailable
+   # on Windows, where the default loop is used.
+   import uvloop
+   uvloop.install()
+except ImportError:
+   pass
+
 from catalog.adapters.base import AdapterConfig
 from catalog.adapters.steam import SteamAdapter
 from catalog.adapters.psn import PSNAdapter